@@ -36,11 +36,16 @@ class PredData:
 
 
 class LogMediaQueue:
-    """Holds a circular queue for each of train/val/test modes, each of which contain the latest N batches of data"""
+    """Holds a circular queue for each of train/val/test modes, each of which contain the latest N batches of data.
+    A queue of length 0 is disabled. Check ``enabled`` to skip preparing data that won't be stored.
+
+    Each mode needs its own queue: validation runs before the end of the train epoch, so with a single shared queue
+    the val batches would evict the train batches before they're logged at train epoch end.
+    """
 
     def __init__(self, max_len: int = 3):
-        if max_len < 1:
-            raise ValueError(f"Queue must be length >= 1. Given: {max_len}")
+        if max_len < 0:
+            raise ValueError(f"Queue must be length >= 0. Given: {max_len}")
 
         self.max_len = max_len
         self.log_media = {
@@ -49,6 +54,11 @@ class LogMediaQueue:
             Mode.TEST: deque(maxlen=self.max_len),
         }
 
+    @property
+    def enabled(self) -> bool:
+        """True if data appended to the queue will be stored. Appending is a no-op on length 0 and on rank > 0"""
+        return self.max_len > 0 and rank_zero_only.rank == 0
+
     def clear(self):
         """Clear all queues"""
         for mode, queue in self.log_media.items():
@@ -78,6 +88,7 @@ class LogMedia(Callback):
 
     This callback required adding an attribute to the LightningModule called ``self.log_media``. This is a circular
     queue that holds the latest N batches. This callback fetches the latest data from the queue for logging.
+    The queued batches are expected to be uint8 tensors: inputs [N, 3, H, W], labels and preds [N, H, W].
 
     Usage:
         import pytorch_lightning as pl
@@ -155,6 +166,8 @@ class LogMedia(Callback):
             )
         if not isinstance(pl_module.log_media, LogMediaQueue):
             raise AttributeError(f"{pl_module.__class__.__name__}.{req_attr} must be of type {LogMediaQueue.__name__}")
+        if pl_module.log_media.max_len < 1:
+            raise ValueError(f"{pl_module.__class__.__name__}.{req_attr} is disabled (length 0). Nothing to log.")
 
         if self.verbose:
             pl_module.print(
@@ -254,11 +267,10 @@ class LogMedia(Callback):
         labels = torch.cat([x["labels"] for x in media_data], dim=0)
         preds = torch.cat([x["preds"] for x in media_data], dim=0)
 
-        # Limit the num of samples and convert to numpy
-        inputs = inputs[: self.max_samples].detach().cpu().numpy().transpose((0, 2, 3, 1))
-        inputs = (inputs * 255).astype(np.uint8)
-        labels = labels[: self.max_samples].detach().cpu().numpy().astype(np.uint8)
-        preds = preds[: self.max_samples].detach().cpu().numpy().astype(np.uint8)
+        # Limit the num of samples and convert to numpy. The LightningModule queues uint8 tensors.
+        inputs = inputs[: self.max_samples].cpu().numpy().transpose((0, 2, 3, 1))
+        labels = labels[: self.max_samples].cpu().numpy()
+        preds = preds[: self.max_samples].cpu().numpy()
 
         out = PredData(inputs=inputs, labels=labels, preds=preds)
 
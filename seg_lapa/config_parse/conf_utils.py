@@ -1,8 +1,13 @@
 import dataclasses
-from typing import Dict, Optional, Sequence
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from omegaconf import DictConfig, OmegaConf
 
+# Validated dataclasses, keyed by (config_category, resolved yaml of the config group). Lets identical config groups
+# (Eg: repeated parsing of the same cfg, or sweep jobs run within one process) reuse the same frozen dataclass.
+# Cached objects are shared between callers, so only fully immutable dataclasses are cached (see `_is_cacheable()`).
+_validated_dataclass_cache: Dict[Tuple[str, str], Any] = {}
+
 
 def asdict_filtered(obj, remove_keys: Optional[Sequence[str]] = None) -> Dict:
     """Returns the attributes of a dataclass in the form of a dict, with unwanted attributes removed.
@@ -29,6 +34,16 @@ def asdict_filtered(obj, remove_keys: Optional[Sequence[str]] = None) -> Dict:
     return args
 
 
+def _is_cacheable(dataclass_obj) -> bool:
+    """A dataclass can be shared between callers only if it is frozen and none of its fields hold mutable containers.
+    Frozen only prevents re-assigning fields. Eg: the dicts in StandardCallbacksConf could still be modified in-place.
+    """
+    if not dataclass_obj.__dataclass_params__.frozen:
+        return False
+    values = (getattr(dataclass_obj, field.name) for field in dataclasses.fields(dataclass_obj))
+    return not any(isinstance(value, (dict, list, set)) for value in values)
+
+
 def validate_config_group_generic(cfg_group: DictConfig, dataclass_dict: Dict, config_category: str = "option"):
     """Use a hydra config group to initialize a pydantic dataclass. Initializing it validates the data.
     Each of our config groups has a name parameter, which is used to map to valid dataclasses for validation.
@@ -36,6 +51,10 @@ def validate_config_group_generic(cfg_group: DictConfig, dataclass_dict: Dict, c
     Pydantic will force the parameters to the desired datatype and will throw errors if the config
     cannot be cast to the dataclass members.
 
+    Frozen dataclasses are cached on the resolved contents of the config group, so identical config groups are only
+    validated once per process. Mutable dataclasses (Eg: logger, which generates a run id) and dataclasses with
+    dict/list/set fields (Eg: callbacks) are always re-created, since a cached object is shared by all callers.
+
     Args:
         cfg_group: The config group extracted from the hydra config.
         dataclass_dict: A dict containing the mapping from 'name' entry in config files to matching
@@ -56,16 +75,23 @@ def validate_config_group_generic(cfg_group: DictConfig, dataclass_dict: Dict, c
             f"  Config:\n {OmegaConf.to_yaml(cfg_group)}"
         )
 
+    cache_key = (config_category, OmegaConf.to_yaml(cfg_group, resolve=True))
+    if cache_key in _validated_dataclass_cache:
+        return _validated_dataclass_cache[cache_key]
+
     # Convert hydra config to dict - This dict contains the arguments to init dataclass
     cfg_asdict = OmegaConf.to_container(cfg_group, resolve=True)
 
     # Get the dataclass to init from the mapping. Init the dataclass using hydra config
-    try:
-        dataclass_obj = dataclass_dict[name](**cfg_asdict)
-    except KeyError:
+    # Check the name explicitly, so that errors raised within the dataclass init are not reported as an invalid name
+    if name not in dataclass_dict:
         raise ValueError(
             f"Invalid Config: '{cfg_group.name}' is not a valid {config_category}. "
             f"Valid Options: {list(dataclass_dict.keys())}"
         )
+    dataclass_obj = dataclass_dict[name](**cfg_asdict)
+
+    if _is_cacheable(dataclass_obj):
+        _validated_dataclass_cache[cache_key] = dataclass_obj
 
     return dataclass_obj
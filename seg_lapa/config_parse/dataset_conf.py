@@ -1,8 +1,9 @@
+import dataclasses
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
 import pytorch_lightning as pl
 from omegaconf import DictConfig
-from pydantic.dataclasses import dataclass
 
 from seg_lapa.config_parse.conf_utils import asdict_filtered, validate_config_group_generic
 from seg_lapa.datasets.lapa import LaPaDataModule
@@ -12,6 +13,13 @@ from seg_lapa.datasets.lapa import LaPaDataModule
 class DatasetConf(ABC):
     name: str
 
+    def __post_init__(self):
+        # Plain dataclass (no pydantic validation). Values resolved from interpolations (Eg: ${env:VAR}) arrive as
+        # str, so cast the int fields explicitly. The dataclass is frozen, hence `object.__setattr__`.
+        for field in dataclasses.fields(self):
+            if field.type is int:
+                object.__setattr__(self, field.name, int(getattr(self, field.name)))
+
     @abstractmethod
     def get_datamodule(self) -> pl.LightningDataModule:
         pass
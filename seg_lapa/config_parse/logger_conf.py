@@ -1,8 +1,9 @@
+import secrets
+import string
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional
 
-import wandb
 from omegaconf import DictConfig, OmegaConf
 from pydantic.dataclasses import dataclass
 from pytorch_lightning import loggers as pl_loggers
@@ -74,10 +75,19 @@ class WandbConf(LoggerConf):
         Otherwise a random run-id will be generated
         """
         if self.run_id is None:
-            self.run_id = wandb.util.generate_id()
+            self.run_id = self.generate_run_id()
 
         return self.run_id
 
+    @staticmethod
+    def generate_run_id(length: int = 8) -> str:
+        """Generate a random run id, in the same format as `wandb.util.generate_id()`.
+        Uses `secrets` instead of the `random` module, which is seeded by `fix_seeds()` before the run id is generated
+        and would give the same id (and resume the same run) every time.
+        """
+        alphabet = string.ascii_lowercase + string.digits
+        return "".join(secrets.choice(alphabet) for _ in range(length))
+
 
 valid_names = {
     "wandb": WandbConf,
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from omegaconf import DictConfig
 from pydantic.dataclasses import dataclass
@@ -22,12 +22,19 @@ from seg_lapa.config_parse.optimizer_conf import OptimConf
 from seg_lapa.config_parse.scheduler_conf import SchedulerConf
 from seg_lapa.config_parse.trainer_conf import TrainerConf
 
+if TYPE_CHECKING:
+    DatasetConfField = DatasetConf
+else:
+    # DatasetConf is a stdlib dataclass. Pydantic would re-validate the field by wrapping DatasetConf in a new
+    # subclass, and reject the LapaConf instance. The type is checked in TrainConf.__post_init_post_parse__() instead.
+    DatasetConfField = Any
+
 
 @dataclass(frozen=True)
 class TrainConf:
     random_seed: Optional[int]
     logs_root_dir: str
-    dataset: DatasetConf
+    dataset: DatasetConfField
     optimizer: OptimConf
     model: ModelConf
     trainer: TrainerConf
@@ -36,6 +43,10 @@ class TrainConf:
     callbacks: CallbacksConf
     load_weights: LoadWeightsConf
 
+    def __post_init_post_parse__(self):
+        if not isinstance(self.dataset, DatasetConf):
+            raise TypeError(f"dataset must be of type {DatasetConf.__name__}. Got: {type(self.dataset)}")
+
 
 class ParseConfig:
     @classmethod
@@ -55,3 +66,40 @@ class ParseConfig:
         )
 
         return config
+
+
+# Tests
+def test_parse_config():
+    from hydra.experimental import compose, initialize
+
+    print("Testing parsing of train.yaml into dataclasses", end="")
+    with initialize(config_path="../config"):
+        cfg = compose(config_name="train")
+
+    config = ParseConfig.parse_config(cfg)
+    assert isinstance(config, TrainConf)
+    assert isinstance(config.dataset, dataset_conf.LapaConf)
+    assert config.dataset.batch_size == cfg.dataset.batch_size
+    print("  passed")
+
+
+def test_parse_config_cache():
+    from hydra.experimental import compose, initialize
+
+    print("Testing caching of validated config groups", end="")
+    with initialize(config_path="../config"):
+        cfg = compose(config_name="train")
+
+    config = ParseConfig.parse_config(cfg)
+    config2 = ParseConfig.parse_config(cfg)
+    assert config2.dataset is config.dataset, "Frozen config groups must be re-used from the cache"
+    assert config2.logger is not config.logger, "Non-frozen config groups must be re-created"
+    assert config2.callbacks is not config.callbacks, "Config groups with mutable fields must be re-created"
+    print("  passed")
+
+
+if __name__ == "__main__":
+    # Run tests
+    print("Running tests on train_conf module...\n")
+    test_parse_config()
+    test_parse_config_cache()
@@ -30,7 +30,7 @@ class TrainerConfig(TrainerConf):
     resume_from_checkpoint: Optional[str]
     log_every_n_steps: int
 
-    benchmark: bool = False
+    benchmark: Optional[bool] = None  # If None, cudnn.benchmark is enabled only when not deterministic
     deterministic: bool = False
     fast_dev_run: bool = False
     overfit_batches: float = 0.0
@@ -41,11 +41,16 @@ class TrainerConfig(TrainerConf):
     def get_trainer(
         self, pl_logger: LightningLoggerBase, callbacks: List[Callback], default_root_dir: str
     ) -> pl.Trainer:
+        trainer_args = asdict_filtered(self)
+        if self.benchmark is None:
+            # cudnn.benchmark picks the fastest conv algorithms for the (fixed) input shapes, but is not deterministic
+            trainer_args["benchmark"] = not self.deterministic
+
         trainer = pl.Trainer(
             logger=pl_logger,
             callbacks=callbacks,
             default_root_dir=default_root_dir,
-            **asdict_filtered(self),
+            **trainer_args,
         )
         return trainer
 
@@ -18,7 +18,9 @@ class CrossEntropy2D(nn.CrossEntropyLoss):
         - Output: scalar.
 
     Args:
-        loss_per_image (bool, optional):
+        loss_per_image (bool, optional): Defaults to True. If True, the loss is summed over all pixels and divided
+            by the batch size (mean loss per image). If False, the loss is averaged over all valid pixels.
+            Either way, the loss is computed by a single call to ``F.cross_entropy``, no loop over the batch.
         ignore_index (int, optional): Defaults to 255. The pixels with this labels do not contribute to loss
 
     References:
@@ -22,8 +22,9 @@ class Iou(metrics.Metric):
 
         Forward accepts:
 
-        - ``prediction`` (float or long tensor): ``(N, H, W)``
-        - ``label`` (long tensor): ``(N, H, W)``
+        - ``prediction`` (float or int tensor): ``(N, H, W)``. Raw outputs of network ``(N, C, H, W)`` are also
+          accepted, the argmax is taken internally.
+        - ``label`` (int tensor): ``(N, H, W)``
 
         Note:
             This metric produces a dataclass as output, so it can not be directly logged.
@@ -47,8 +48,12 @@ class Iou(metrics.Metric):
 
         Args:
             prediction: Predictions of network (after argmax). Shape: [N, H, W]
+                        Or the raw outputs of network (before argmax). Shape: [N, C, H, W]
             label: Ground truth. Each pixel has int value denoting class. Shape: [N, H, W]
         """
+        if len(prediction.shape) == 4:
+            prediction = prediction.argmax(dim=1)
+
         assert prediction.shape == label.shape
         assert len(label.shape) == 3
 
@@ -57,8 +62,9 @@ class Iou(metrics.Metric):
         label = label.view(-1).long()
         prediction = prediction.view(-1).long()
 
-        # Calculate confusion matrix
-        conf_mat = torch.bincount(self.num_classes * label + prediction, minlength=self.num_classes ** 2)
+        # Calculate confusion matrix. Index of each pixel = (num_classes * label + prediction), done in a single op
+        conf_idx = torch.add(prediction, label, alpha=self.num_classes)
+        conf_mat = torch.bincount(conf_idx, minlength=self.num_classes ** 2)
         conf_mat = conf_mat.reshape((self.num_classes, self.num_classes))
 
         # Accumulate values
@@ -134,6 +140,14 @@ def test_iou():
     assert (iou_per_class - expected_iou).sum() < 1e-6
     print("  passed")
 
+    print("Testing IoU metrics with raw outputs", end="")
+    outputs = torch.stack((1 - pred, pred), dim=1)  # Shape: [N, C, H, W]
+    iou_train.reset()
+    iou_train(outputs, label)
+    metrics_r = iou_train.compute()
+    assert (metrics_r.iou_per_class - expected_iou).sum() < 1e-6
+    print("  passed")
+
 
 if __name__ == "__main__":
     # Run tests
@@ -1,8 +1,9 @@
-from typing import Any, List
+from typing import Any, Dict, List
 
 import hydra
 import numpy as np
 import pytorch_lightning as pl
+import torch
 import wandb
 from omegaconf import DictConfig
 from pytorch_lightning import loggers as pl_loggers
@@ -14,6 +15,10 @@ from seg_lapa.loss_func import CrossEntropy2D
 from seg_lapa.utils import utils
 from seg_lapa.utils.utils import is_rank_zero
 
+# Lightning runs val/test under `torch.no_grad()`. `torch.inference_mode()` (torch >= 1.9) also skips the version
+# counter and autograd metadata of the output tensors. Falls back to `no_grad` on older versions.
+inference_mode = getattr(torch, "inference_mode", torch.no_grad)
+
 
 class DeeplabV3plus(pl.LightningModule, ParseConfig):
     def __init__(self, cfg: DictConfig, log_media_max_batches=1):
@@ -25,12 +30,15 @@ class DeeplabV3plus(pl.LightningModule, ParseConfig):
         self.cross_entropy_loss = CrossEntropy2D(loss_per_image=True, ignore_index=255)
         self.model = self.config.model.get_model()
 
+        # Separate metric per mode: validation runs before training_epoch_end(), so a shared metric would mix
+        # train and val batches. States are small (num_classes^2) and not saved in the state_dict.
         self.iou_train = metrics.Iou(num_classes=self.config.model.num_classes)
         self.iou_val = metrics.Iou(num_classes=self.config.model.num_classes)
         self.iou_test = metrics.Iou(num_classes=self.config.model.num_classes)
 
         # Logging media such a images using `self.log()` is extremely memory-expensive.
         # Save predictions to be logged within a circular queue, to be consumed in the LogMedia callback.
+        # If log_media_max_batches is 0, the queue is disabled and predictions are not computed for logging.
         self.log_media: LogMediaQueue = LogMediaQueue(log_media_max_batches)
 
     def forward(self, x):
@@ -46,75 +54,115 @@ class DeeplabV3plus(pl.LightningModule, ParseConfig):
         """
         inputs, labels = batch
         outputs = self.model(inputs)
-        predictions = outputs.argmax(dim=1)
 
         # Calculate Loss
         loss = self.cross_entropy_loss(outputs, labels)
 
-        """Log the value on GPU0 per step. Also log average of all steps at epoch_end."""
-        self.log("Train/loss", loss, on_step=True, on_epoch=True)
-        """Log the avg. value across all GPUs per step. Also log average of all steps at epoch_end.
-        Alternately, you can use the ops 'sum' or 'avg'.
-        Using sync_dist is efficient. It adds extremely minor overhead for scalar values.
+        """Log the value on GPU0 per step, without syncing across GPUs.
+        The average across all GPUs is logged once in training_epoch_end(): with `sync_dist=True`, `self.log()`
+        reduces the value across GPUs immediately, i.e. it would add an allreduce to every step.
         """
-        # self.log("Train/loss", loss, on_step=True, on_epoch=True, sync_dist=True, sync_dist_op="avg")
+        self.log("Train/loss_step", loss, on_step=True, on_epoch=False)
 
         # Calculate Metrics
-        self.iou_train(predictions, labels)
+        if self.log_media.enabled:
+            # Predictions are also needed for logging. Take the argmax once and pass it to the metric.
+            predictions = outputs.argmax(dim=1)
+            self.iou_train(predictions, labels)
 
-        # Returning images is expensive - All the batches are accumulated for _epoch_end().
-        # Save the latst predictions to be logged in an attr. They will be consumed by the LogMedia callback.
-        self.log_media.append({"inputs": inputs, "labels": labels, "preds": predictions}, Mode.TRAIN)
+            # Returning images is expensive - All the batches are accumulated for _epoch_end().
+            # Save the latst predictions to be logged in an attr. They will be consumed by the LogMedia callback.
+            self.log_media.append(self.media_to_uint8(inputs, labels, predictions), Mode.TRAIN)
+        else:
+            self.iou_train(outputs, labels)  # Argmax is taken within the metric
 
         return {"loss": loss}
 
     def validation_step(self, batch, batch_idx):
         inputs, labels = batch
-        outputs = self.model(inputs)
-        predictions = outputs.argmax(dim=1)
+        with inference_mode():
+            outputs = self.model(inputs)
 
         # Calculate Loss
         loss = self.cross_entropy_loss(outputs, labels)
-        self.log("Val/loss", loss)
 
         # Calculate Metrics
-        self.iou_val(predictions, labels)
+        if self.log_media.enabled:
+            # Predictions are also needed for logging. Take the argmax once and pass it to the metric.
+            predictions = outputs.argmax(dim=1)
+            self.iou_val(predictions, labels)
 
-        # Save the latest predictions to be logged
-        self.log_media.append({"inputs": inputs, "labels": labels, "preds": predictions}, Mode.VAL)
+            # Save the latest predictions to be logged
+            self.log_media.append(self.media_to_uint8(inputs, labels, predictions), Mode.VAL)
+        else:
+            self.iou_val(outputs, labels)  # Argmax is taken within the metric
 
         return {"val_loss": loss}
 
     def test_step(self, batch, batch_idx):
         inputs, labels = batch
-        outputs = self.model(inputs)
-        predictions = outputs.argmax(dim=1)
+        with inference_mode():
+            outputs = self.model(inputs)
 
         # Calculate Loss
         loss = self.cross_entropy_loss(outputs, labels)
-        self.log("Test/loss", loss)
 
         # Calculate Metrics
-        self.iou_test(predictions, labels)
+        if self.log_media.enabled:
+            # Predictions are also needed for logging. Take the argmax once and pass it to the metric.
+            predictions = outputs.argmax(dim=1)
+            self.iou_test(predictions, labels)
 
-        # Save the latest predictions to be logged
-        self.log_media.append({"inputs": inputs, "labels": labels, "preds": predictions}, Mode.TEST)
+            # Save the latest predictions to be logged
+            self.log_media.append(self.media_to_uint8(inputs, labels, predictions), Mode.TEST)
+        else:
+            self.iou_test(outputs, labels)  # Argmax is taken within the metric
 
         return {"test_loss": loss}
 
+    @staticmethod
+    def media_to_uint8(
+        inputs: torch.Tensor, labels: torch.Tensor, predictions: torch.Tensor
+    ) -> Dict[str, torch.Tensor]:
+        """Convert a batch to uint8 for the LogMediaQueue. This is done on the GPU, without syncing with the host.
+        The queue holds its batches until they're logged, uint8 keeps 4-8x less GPU memory than float32/int64.
+
+        Args:
+            inputs: RGB images in range [0, 1]. Shape: [N, 3, H, W]
+            labels: Ground truth. Shape: [N, H, W]
+            predictions: Predictions of network (after argmax). Shape: [N, H, W]
+        """
+        return {
+            "inputs": inputs.mul(255).to(torch.uint8),
+            "labels": labels.to(torch.uint8),
+            "preds": predictions.to(torch.uint8),
+        }
+
     def training_epoch_end(self, outputs: List[Any]):
+        # Average loss across all steps and GPUs. Syncs only once per epoch.
+        loss_avg = torch.stack([x["loss"] for x in outputs]).mean()
+        self.log("Train/loss", loss_avg, sync_dist=True, sync_dist_op="avg")
+
         # Compute and log metrics across epoch
         metrics_avg = self.iou_train.compute()
         self.log("Train/mIoU", metrics_avg.miou)
         self.iou_train.reset()
 
     def validation_epoch_end(self, outputs: List[Any]):
+        # Average loss across all steps and GPUs. Syncs only once per epoch.
+        loss_avg = torch.stack([x["val_loss"] for x in outputs]).mean()
+        self.log("Val/loss", loss_avg, sync_dist=True, sync_dist_op="avg")
+
         # Compute and log metrics across epoch
         metrics_avg = self.iou_val.compute()
         self.log("Val/mIoU", metrics_avg.miou)
         self.iou_val.reset()
 
     def test_epoch_end(self, outputs: List[Any]):
+        # Average loss across all steps and GPUs. Syncs only once per epoch.
+        loss_avg = torch.stack([x["test_loss"] for x in outputs]).mean()
+        self.log("Test/loss", loss_avg, sync_dist=True, sync_dist_op="avg")
+
         # Compute and log metrics across epoch
         metrics_avg = self.iou_test.compute()
         self.log("Test/mIoU", metrics_avg.miou)
@@ -171,6 +219,12 @@ class DeeplabV3plus(pl.LightningModule, ParseConfig):
 
         return ret_opt
 
+    def optimizer_zero_grad(self, epoch, batch_idx, optimizer, optimizer_idx):
+        """Set grads to None instead of filling them with zeros. Skips a write over every grad tensor per step.
+        Note: Overriding this hook requires `accumulate_grad_batches=1` in the Trainer.
+        """
+        optimizer.zero_grad(set_to_none=True)
+
 
 @hydra.main(config_path="config", config_name="train")
 def main(cfg: DictConfig):
@@ -188,11 +242,16 @@ def main(cfg: DictConfig):
     callbacks = config.callbacks.get_callbacks_list(exp_dir, cfg)
     dm = config.dataset.get_datamodule()
 
+    # Predictions are only queued for logging if the LogMedia callback is used
+    log_media_max_batches = 0 if getattr(config.callbacks, "log_media", None) is None else 1
+
     # Load weights
     if config.load_weights.path is None:
-        model = DeeplabV3plus(cfg)
+        model = DeeplabV3plus(cfg, log_media_max_batches=log_media_max_batches)
     else:
-        model = DeeplabV3plus.load_from_checkpoint(config.load_weights.path, cfg=cfg)
+        model = DeeplabV3plus.load_from_checkpoint(
+            config.load_weights.path, cfg=cfg, log_media_max_batches=log_media_max_batches
+        )
 
     trainer = config.trainer.get_trainer(wb_logger, callbacks, config.logs_root_dir)
 
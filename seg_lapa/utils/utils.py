@@ -1,4 +1,5 @@
 import datetime
+import functools
 import os
 from pathlib import Path
 from typing import Optional
@@ -12,7 +13,9 @@ from seg_lapa.utils import path_check
 LOGS_DIR = "log-media"
 
 
+@functools.lru_cache(maxsize=1)
 def is_rank_zero():
+    """Rank is read from env vars once, on the first call, and cached. The rank of a process does not change."""
     local_rank = int(os.environ.get("LOCAL_RANK", 0))
     node_rank = int(os.environ.get("NODE_RANK", 0))
     if local_rank == 0 and node_rank == 0:
@@ -47,7 +50,9 @@ def generate_log_dir_path(config: TrainConf) -> Path:
 
 
 def fix_seeds(random_seed: Optional[int]) -> None:
-    """Fix seeds for reproducibility.
+    """Fix seeds for reproducibility. Should be called once per process, before the model and trainer are created.
+    The dataloader workers are seeded from this via `LaPaDataModule._dataloader_worker_init()`.
+
     Ref:
         https://pytorch.org/docs/stable/notes/randomness.html
 